@@ -343,6 +343,19 @@ def wrap_longitudes(lon):
     # convert phi from radians to degrees
     return phi*180.0/np.pi
 
+# wrap longitudes and calculate the centroid and winding of a polygon
+def summarize_ring(lon,lat):
+    lon = wrap_longitudes(np.asarray(lon, dtype=np.float64))
+    lat = np.asarray(lat, dtype=np.float64)
+    # signed areas between successive vertices
+    SA = lon[:-1]*lat[1:] - lon[1:]*lat[:-1]
+    area = 3.0*np.sum(SA)
+    cx = np.sum((lon[:-1] + lon[1:])*SA)/area
+    cy = np.sum((lat[:-1] + lat[1:])*SA)/area
+    # positive winding is clockwise
+    wind = np.sum((lon[1:] - lon[:-1])*(lat[1:] + lat[:-1]))
+    return (lon,lat,cx,cy,wind)
+
 # convert coordinates to a sliderule region
 def to_region(lon,lat):
     region = [{'lon':ln,'lat':lt} for ln,lt in np.c_[lon,lat]]
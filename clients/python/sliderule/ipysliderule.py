@@ -31,16 +31,24 @@ import os
 import io
 import sys
 import copy
+import base64
+import asyncio
 import datetime
+import importlib.util
+import functools
+import itertools
 import traceback
 import numpy as np
+import shapely
 import collections.abc
 import geopandas as gpd
 import matplotlib.lines
 import matplotlib.cm as cm
+import matplotlib.figure
 import matplotlib.colorbar
 import matplotlib.pyplot as plt
 import matplotlib.colors as colors
+from shapely.geometry import Polygon
 from traitlets.utils.bunch import Bunch
 from sliderule import logger
 import sliderule.io
@@ -59,6 +67,16 @@ try:
 except ModuleNotFoundError as e:
     sys.stderr.write("Warning: missing packages, some functions will throw an exception if called. (%s)\n" % (str(e)))
 
+# imports that fall back to slower methods if not present
+try:
+    import numba
+except ModuleNotFoundError as e:
+    numba = None
+try:
+    import ipyfilechooser
+except ModuleNotFoundError as e:
+    ipyfilechooser = None
+
 # imports that raise error if not present
 try:
     import ipyleaflet
@@ -72,18 +90,82 @@ except ModuleNotFoundError as e:
     sys.stderr.write("Error: missing required packages. (%s)\n" % (str(e)))
     raise
 
+# dropdown options for setting surface type
+# 0-land, 1-ocean, 2-sea ice, 3-land ice, 4-inland water
+_SURFACE_TYPE_OPTIONS = ('Land', 'Ocean', 'Sea ice', 'Land ice', 'Inland water')
+# selection options for land surface classifications
+_LAND_OPTIONS = ('atl08_noise', 'atl08_ground', 'atl08_canopy',
+    'atl08_top_of_canopy', 'atl08_unclassified')
+# default land surface classifications for ATL08-SR requests
+_ATL08_LAND_OPTIONS = ('atl08_ground', 'atl08_canopy', 'atl08_top_of_canopy')
+# selection options for ATL03 quality flags
+_QUALITY_OPTIONS = ('atl03_nominal', 'atl03_possible_afterpulse',
+    'atl03_possible_impulse_response', 'atl03_possible_tep')
+# dropdown options for map projections
+_PROJECTION_OPTIONS = ('Global', 'North', 'South')
+# contextual layers available for each map projection
+_LAYER_OPTIONS = dict(
+    Global=('3DEP', 'ASTER GDEM', 'ESRI imagery', 'GLIMS', 'RGI'),
+    North=('ESRI imagery', 'ArcticDEM'),
+    South=('LIMA', 'MOA', 'RAMP', 'REMA'),
+)
+# variables to draw on map for each SlideRule product
+_ATL03_VARIABLES = ('atl03_cnf', 'atl08_class', 'cycle', 'delta_time',
+    'x_atc', 'height', 'pair', 'quality_ph', 'rgt', 'sc_orient',
+    'segment_dist', 'segment_id', 'track', 'yapc_score')
+_ATL06_VARIABLES = ('h_mean', 'h_sigma', 'dh_fit_dx', 'dh_fit_dy',
+    'rms_misfit', 'w_surface_window_final', 'delta_time',
+    'cycle', 'rgt')
+_ATL08_VARIABLES = ('h_canopy', 'h_min_canopy', 'h_mean_canopy',
+    'h_max_canopy', 'canopy_openness', 'h_te_median',
+    'landcover', 'snowcover', 'solar_elevation', 'cycle', 'rgt')
+# colormaps available in this program
+# (no reversed, qualitative or miscellaneous)
+_CMAPS_LISTED = {}
+_CMAPS_LISTED['Perceptually Uniform Sequential'] = (
+    'viridis','plasma','inferno','magma','cividis')
+_CMAPS_LISTED['Sequential'] = ('Greys','Purples',
+    'Blues','Greens','Oranges','Reds','YlOrBr','YlOrRd',
+    'OrRd','PuRd','RdPu','BuPu','GnBu','PuBu','YlGnBu',
+    'PuBuGn','BuGn','YlGn')
+_CMAPS_LISTED['Sequential (2)'] = ('binary','gist_yarg',
+    'gist_gray','gray','bone','pink','spring','summer',
+    'autumn','winter','cool','Wistia','hot','afmhot',
+    'gist_heat','copper')
+_CMAPS_LISTED['Diverging'] = ('PiYG','PRGn','BrBG',
+    'PuOr','RdGy','RdBu','RdYlBu','RdYlGn','Spectral',
+    'coolwarm', 'bwr','seismic')
+_CMAPS_LISTED['Cyclic'] = ('twilight',
+    'twilight_shifted','hsv')
+# reduce colormaps to available in program and matplotlib
+_CMAP_OPTIONS = sorted((set(cm.datad.keys()) | set(cm.cmaps_listed.keys())) &
+    set(itertools.chain.from_iterable(_CMAPS_LISTED.values())))
+
 class widgets:
+    """ipywidgets for setting SlideRule request parameters,
+    with each widget created when first accessed
+    """
     def __init__(self, **kwargs):
         # set default keyword options
         kwargs.setdefault('style', {})
         # set style
-        self.style = copy.copy(kwargs['style'])
+        self.style = kwargs['style']
         # pass through some ipywidgets objects
         self.HBox = ipywidgets.HBox
         self.VBox = ipywidgets.VBox
+        # debounced observers for widgets
+        self._debounced = {}
+
+        # colormaps available in this program
+        self.cmaps_listed = dict(_CMAPS_LISTED)
+        # default output file
+        self.file = self.atl06_filename
 
-        # dropdown menu for setting asset
-        self.asset = ipywidgets.Dropdown(
+    @functools.cached_property
+    def asset(self):
+        """dropdown menu for setting asset
+        """
+        return ipywidgets.Dropdown(
             options=['atlas-local', 'atlas-s3', 'icesat2'],
             value='icesat2',
             description='Asset:',
@@ -92,8 +174,11 @@ class widgets:
             style=self.style,
         )
 
-        # dropdown menu for ICESat-2 product
-        self.product = ipywidgets.Dropdown(
+    @functools.cached_property
+    def product(self):
+        """dropdown menu for ICESat-2 product
+        """
+        return ipywidgets.Dropdown(
             options=['ATL03', 'ATL06', 'ATL08'],
             value='ATL03',
             description='Product:',
@@ -105,8 +190,11 @@ class widgets:
             style=self.style,
         )
 
-        # dropdown menu for setting data release
-        self.release = ipywidgets.Dropdown(
+    @functools.cached_property
+    def release(self):
+        """dropdown menu for setting data release
+        """
+        return ipywidgets.Dropdown(
             options=['003', '004', '005', '006'],
             value='006',
             description='Release:',
@@ -115,23 +203,34 @@ class widgets:
             style=self.style,
         )
 
-        self.start_date = ipywidgets.DatePicker(
+    @functools.cached_property
+    def start_date(self):
+        """date picker for setting start date of CMR queries
+        """
+        return ipywidgets.DatePicker(
             value=datetime.datetime(2018,10,13,0,0,0),
             description='Start Date',
             description_tooltip="Start Date: Starting date for CMR queries",
             disabled=False
         )
 
-        self.end_date = ipywidgets.DatePicker(
+    @functools.cached_property
+    def end_date(self):
+        """date picker for setting end date of CMR queries
+        """
+        return ipywidgets.DatePicker(
             value=datetime.datetime.now(),
             description='End Date',
             description_tooltip="End Date: Ending date for CMR queries",
             disabled=False
         )
 
-        # multiple select for photon classification
+    @functools.cached_property
+    def classification(self):
+        """multiple select for photon classification
+        """
         class_options = ['atl03', 'quality', 'atl08', 'yapc']
-        self.classification = ipywidgets.SelectMultiple(
+        classification = ipywidgets.SelectMultiple(
             options=class_options,
             value=['atl03','atl08'],
             description='Classification:',
@@ -143,21 +242,17 @@ class widgets:
             disabled=False,
             style=self.style,
         )
-
         # watch classification widgets for changes
-        self.classification.observe(self.set_classification)
+        classification.observe(self.set_classification)
+        return classification
 
-        # dropdown menu for setting surface type
+    @functools.cached_property
+    def surface_type(self):
+        """dropdown menu for setting surface type
+        """
         # 0-land, 1-ocean, 2-sea ice, 3-land ice, 4-inland water
-        surface_type_options = [
-            'Land',
-            'Ocean',
-            'Sea ice',
-            'Land ice',
-            'Inland water'
-        ]
-        self.surface_type = ipywidgets.Dropdown(
-            options=surface_type_options,
+        surface_type = ipywidgets.Dropdown(
+            options=_SURFACE_TYPE_OPTIONS,
             value='Land',
             description='Surface Type:',
             description_tooltip=("Surface Type: ATL03 surface type for confidence "
@@ -166,11 +261,15 @@ class widgets:
             disabled=False,
             style=self.style,
         )
-        self.surface_type.layout.display = 'inline-flex'
+        surface_type.layout.display = 'inline-flex'
+        return surface_type
 
-        # slider for setting confidence level for PE selection
+    @functools.cached_property
+    def confidence(self):
+        """slider for setting confidence level for PE selection
+        """
         # eventually would be good to switch this to a IntRangeSlider with value=[0,4]
-        self.confidence = ipywidgets.IntSlider(
+        confidence = ipywidgets.IntSlider(
             value=4,
             min=-2,
             max=4,
@@ -186,18 +285,15 @@ class widgets:
             readout_format='d',
             style=self.style,
         )
-        self.confidence.layout.display = 'inline-flex'
-
-        # selection for land surface classifications
-        land_options = [
-            'atl08_noise',
-            'atl08_ground',
-            'atl08_canopy',
-            'atl08_top_of_canopy',
-            'atl08_unclassified'
-        ]
-        self.land_class = ipywidgets.SelectMultiple(
-            options=land_options,
+        confidence.layout.display = 'inline-flex'
+        return confidence
+
+    @functools.cached_property
+    def land_class(self):
+        """selection for land surface classifications
+        """
+        land_class = ipywidgets.SelectMultiple(
+            options=_LAND_OPTIONS,
             description='Land Class:',
             description_tooltip=("Land Class: ATL08 land classification "
                 "for photons\n\t0: noise\n\t1: ground\n\t2: canopy\n\t"
@@ -205,18 +301,16 @@ class widgets:
             disabled=False,
             style=self.style,
         )
-        self.land_class.layout.display = 'inline-flex'
-
-        # selection for ATL03 quality flags
-        quality_options = [
-            'atl03_nominal',
-            'atl03_possible_afterpulse',
-            'atl03_possible_impulse_response',
-            'atl03_possible_tep'
-        ]
-        self.quality = ipywidgets.SelectMultiple(
+        land_class.layout.display = 'inline-flex'
+        return land_class
+
+    @functools.cached_property
+    def quality(self):
+        """selection for ATL03 quality flags
+        """
+        quality = ipywidgets.SelectMultiple(
             value=['atl03_nominal'],
-            options=quality_options,
+            options=_QUALITY_OPTIONS,
             description='Quality:',
             description_tooltip=("Quality: ATL03 photon quality "
                 "classification\n\t0: nominal\n\t"
@@ -226,10 +320,14 @@ class widgets:
             disabled=False,
             style=self.style,
         )
-        self.quality.layout.display = 'none'
+        quality.layout.display = 'none'
+        return quality
 
-        # slider for setting for YAPC kNN
-        self.yapc_knn = ipywidgets.IntSlider(
+    @functools.cached_property
+    def yapc_knn(self):
+        """slider for setting for YAPC kNN
+        """
+        yapc_knn = ipywidgets.IntSlider(
             value=0,
             min=0,
             max=20,
@@ -245,10 +343,14 @@ class widgets:
             readout_format='d',
             style=self.style,
         )
-        self.yapc_knn.layout.display = 'none'
+        yapc_knn.layout.display = 'none'
+        return yapc_knn
 
-        # slider for setting for YAPC height window
-        self.yapc_win_h = ipywidgets.FloatSlider(
+    @functools.cached_property
+    def yapc_win_h(self):
+        """slider for setting for YAPC height window
+        """
+        yapc_win_h = ipywidgets.FloatSlider(
             value=3.0,
             min=0.1,
             max=100,
@@ -263,10 +365,14 @@ class widgets:
             readout_format='0.1f',
             style=self.style,
         )
-        self.yapc_win_h.layout.display = 'none'
+        yapc_win_h.layout.display = 'none'
+        return yapc_win_h
 
-        # slider for setting for YAPC along-track distance window
-        self.yapc_win_x = ipywidgets.FloatSlider(
+    @functools.cached_property
+    def yapc_win_x(self):
+        """slider for setting for YAPC along-track distance window
+        """
+        yapc_win_x = ipywidgets.FloatSlider(
             value=15.0,
             min=0.1,
             max=100,
@@ -281,10 +387,14 @@ class widgets:
             readout_format='0.1f',
             style=self.style,
         )
-        self.yapc_win_x.layout.display = 'none'
+        yapc_win_x.layout.display = 'none'
+        return yapc_win_x
 
-        # slider for setting for YAPC minimum photon events
-        self.yapc_min_ph = ipywidgets.IntSlider(
+    @functools.cached_property
+    def yapc_min_ph(self):
+        """slider for setting for YAPC minimum photon events
+        """
+        yapc_min_ph = ipywidgets.IntSlider(
             value=4,
             min=0,
             max=20,
@@ -299,10 +409,14 @@ class widgets:
             readout_format='d',
             style=self.style,
         )
-        self.yapc_min_ph.layout.display = 'none'
+        yapc_min_ph.layout.display = 'none'
+        return yapc_min_ph
 
-        # slider for setting for YAPC weights for fit
-        self.yapc_weight = ipywidgets.IntSlider(
+    @functools.cached_property
+    def yapc_weight(self):
+        """slider for setting for YAPC weights for fit
+        """
+        yapc_weight = ipywidgets.IntSlider(
             value=80,
             min=0,
             max=255,
@@ -317,11 +431,15 @@ class widgets:
             readout_format='d',
             style=self.style,
         )
-        self.yapc_weight.layout.display = 'none'
+        yapc_weight.layout.display = 'none'
+        return yapc_weight
 
-        # ATL08 PhoREAL parameters
-        # slider for setting PhoREAL histogram bin size
-        self.phoreal_binsize = ipywidgets.FloatSlider(
+    # ATL08 PhoREAL parameters
+    @functools.cached_property
+    def phoreal_binsize(self):
+        """slider for setting PhoREAL histogram bin size
+        """
+        return ipywidgets.FloatSlider(
             value=1,
             min=0.25,
             max=10,
@@ -336,12 +454,15 @@ class widgets:
             style=self.style,
         )
 
-        # dropdown menu for setting PhoREAL geolocation algorithm
+    @functools.cached_property
+    def phoreal_geolocation(self):
+        """dropdown menu for setting PhoREAL geolocation algorithm
+        """
         # mean - takes the average value across all photons in the segment
         # median - takes the median value across all photons in the segment
         # center - takes the halfway value calculated by the average of the first and last photon in the segment
         phoreal_geolocation_list = ['mean','median','center']
-        self.phoreal_geolocation = ipywidgets.Dropdown(
+        return ipywidgets.Dropdown(
             options=phoreal_geolocation_list,
             value='center',
             description='PhoREAL Geolocation:',
@@ -353,8 +474,11 @@ class widgets:
             style=self.style,
         )
 
-        # checkbox for using PhoREAL absolute elevation
-        self.phoreal_abs_h = ipywidgets.Checkbox(
+    @functools.cached_property
+    def phoreal_abs_h(self):
+        """checkbox for using PhoREAL absolute elevation
+        """
+        return ipywidgets.Checkbox(
             value=False,
             description='PhoREAL use abs h',
             description_tooltip=("PhoREAL use abs h: use absolute photon heights "
@@ -363,8 +487,11 @@ class widgets:
             style=self.style,
         )
 
-        # checkbox for using the PhoREAL ABoVE classifier
-        self.phoreal_above = ipywidgets.Checkbox(
+    @functools.cached_property
+    def phoreal_above(self):
+        """checkbox for using the PhoREAL ABoVE classifier
+        """
+        return ipywidgets.Checkbox(
             value=False,
             description='PhoREAL use ABoVE',
             description_tooltip="PhoREAL use ABoVE: use the ABoVE photon classifier",
@@ -372,8 +499,11 @@ class widgets:
             style=self.style,
         )
 
-        # checkbox for sending PhoREAL waveform
-        self.phoreal_waveform = ipywidgets.Checkbox(
+    @functools.cached_property
+    def phoreal_waveform(self):
+        """checkbox for sending PhoREAL waveform
+        """
+        return ipywidgets.Checkbox(
             value=False,
             description='PhoREAL waveform',
             description_tooltip=("PhoREAL waveform: send the photon height "
@@ -382,8 +512,11 @@ class widgets:
             style=self.style,
         )
 
-        # slider for setting length of ATL06-SR segment in meters
-        self.length = ipywidgets.IntSlider(
+    @functools.cached_property
+    def length(self):
+        """slider for setting length of ATL06-SR segment in meters
+        """
+        length = ipywidgets.IntSlider(
             value=40,
             min=5,
             max=200,
@@ -397,9 +530,15 @@ class widgets:
             readout_format='d',
             style=self.style,
         )
+        # watch widget for changes
+        length.observe(self.set_default_values_from_length)
+        return length
 
-        # slider for setting step distance for successive segments in meters
-        self.step = ipywidgets.IntSlider(
+    @functools.cached_property
+    def step(self):
+        """slider for setting step distance for successive segments in meters
+        """
+        return ipywidgets.IntSlider(
             value=20,
             min=5,
             max=200,
@@ -414,9 +553,12 @@ class widgets:
             style=self.style,
         )
 
-        # slider for setting maximum number of iterations
+    @functools.cached_property
+    def iteration(self):
+        """slider for setting maximum number of iterations
+        """
         # (not including initial least-squares-fit selection)
-        self.iteration = ipywidgets.IntSlider(
+        return ipywidgets.IntSlider(
             value=6,
             min=0,
             max=20,
@@ -432,8 +574,11 @@ class widgets:
             style=self.style,
         )
 
-        # slider for setting minimum along track spread
-        self.spread = ipywidgets.FloatSlider(
+    @functools.cached_property
+    def spread(self):
+        """slider for setting minimum along track spread
+        """
+        return ipywidgets.FloatSlider(
             value=20,
             min=1,
             max=100,
@@ -448,8 +593,12 @@ class widgets:
             readout_format='0.1f',
             style=self.style,
         )
-        # slider for setting minimum photon event (PE) count
-        self.count = ipywidgets.IntSlider(
+
+    @functools.cached_property
+    def count(self):
+        """slider for setting minimum photon event (PE) count
+        """
+        return ipywidgets.IntSlider(
             value=10,
             min=1,
             max=50,
@@ -465,8 +614,11 @@ class widgets:
             style=self.style,
         )
 
-        # slider for setting minimum height of PE window in meters
-        self.window = ipywidgets.FloatSlider(
+    @functools.cached_property
+    def window(self):
+        """slider for setting minimum height of PE window in meters
+        """
+        return ipywidgets.FloatSlider(
             value=3,
             min=0.5,
             max=10,
@@ -482,8 +634,11 @@ class widgets:
             style=self.style,
         )
 
-        # slider for setting maximum robust dispersion in meters
-        self.sigma = ipywidgets.FloatSlider(
+    @functools.cached_property
+    def sigma(self):
+        """slider for setting maximum robust dispersion in meters
+        """
+        return ipywidgets.FloatSlider(
             value=5,
             min=1,
             max=10,
@@ -498,16 +653,15 @@ class widgets:
             style=self.style,
         )
 
-        # watch widgets for changes
-        self.length.observe(self.set_default_values_from_length)
-
-        # dropdown menu for setting map projection
+    @functools.cached_property
+    def projection(self):
+        """dropdown menu for setting map projection
+        """
         # Global: Web Mercator (EPSG:3857)
         # North: Alaska Polar Stereographic (EPSG:5936)
         # South: Polar Stereographic South (EPSG:3031)
-        projection_list = ['Global','North','South']
-        self.projection = ipywidgets.Dropdown(
-            options=projection_list,
+        projection = ipywidgets.Dropdown(
+            options=_PROJECTION_OPTIONS,
             value='Global',
             description='Projection:',
             description_tooltip=("Projection: leaflet map projection\n\t"
@@ -517,13 +671,16 @@ class widgets:
             disabled=False,
             style=self.style,
         )
+        # watch widget for changes
+        projection.observe(self.set_layers)
+        return projection
 
-        # dropdown menu for selecting variable to draw on map
-        variable_list = ['h_mean', 'h_sigma', 'dh_fit_dx', 'dh_fit_dy',
-            'rms_misfit', 'w_surface_window_final', 'delta_time',
-            'cycle', 'rgt']
-        self.variable = ipywidgets.Dropdown(
-            options=variable_list,
+    @functools.cached_property
+    def variable(self):
+        """dropdown menu for selecting variable to draw on map
+        """
+        return ipywidgets.Dropdown(
+            options=_ATL06_VARIABLES,
             value='h_mean',
             description='Variable:',
             description_tooltip="Variable: variable to display on leaflet map",
@@ -531,35 +688,12 @@ class widgets:
             style=self.style,
         )
 
-        # all listed colormaps in matplotlib version
-        cmap_set = set(cm.datad.keys()) | set(cm.cmaps_listed.keys())
-        # colormaps available in this program
-        # (no reversed, qualitative or miscellaneous)
-        self.cmaps_listed = {}
-        self.cmaps_listed['Perceptually Uniform Sequential'] = [
-            'viridis','plasma','inferno','magma','cividis']
-        self.cmaps_listed['Sequential'] = ['Greys','Purples',
-            'Blues','Greens','Oranges','Reds','YlOrBr','YlOrRd',
-            'OrRd','PuRd','RdPu','BuPu','GnBu','PuBu','YlGnBu',
-            'PuBuGn','BuGn','YlGn']
-        self.cmaps_listed['Sequential (2)'] = ['binary','gist_yarg',
-            'gist_gray','gray','bone','pink','spring','summer',
-            'autumn','winter','cool','Wistia','hot','afmhot',
-            'gist_heat','copper']
-        self.cmaps_listed['Diverging'] = ['PiYG','PRGn','BrBG',
-            'PuOr','RdGy','RdBu','RdYlBu','RdYlGn','Spectral',
-            'coolwarm', 'bwr','seismic']
-        self.cmaps_listed['Cyclic'] = ['twilight',
-            'twilight_shifted','hsv']
-        # create list of available colormaps in program
-        cmap_list = []
-        for val in self.cmaps_listed.values():
-            cmap_list.extend(val)
-        # reduce colormaps to available in program and matplotlib
-        cmap_set &= set(cmap_list)
-        # dropdown menu for setting colormap
-        self.cmap = ipywidgets.Dropdown(
-            options=sorted(cmap_set),
+    @functools.cached_property
+    def cmap(self):
+        """dropdown menu for setting colormap
+        """
+        return ipywidgets.Dropdown(
+            options=_CMAP_OPTIONS,
             value='viridis',
             description='Colormap:',
             description_tooltip=("Colormap: matplotlib colormaps "
@@ -568,8 +702,11 @@ class widgets:
             style=self.style,
         )
 
-        # Reverse the colormap
-        self.reverse = ipywidgets.Checkbox(
+    @functools.cached_property
+    def reverse(self):
+        """Reverse the colormap
+        """
+        return ipywidgets.Checkbox(
             value=False,
             description='Reverse Colormap',
             description_tooltip=("Reverse Colormap: reverse matplotlib "
@@ -578,19 +715,26 @@ class widgets:
             style=self.style,
         )
 
-        # selection for adding layers to map
-        layer_options = ['3DEP','ASTER GDEM','ESRI imagery','GLIMS','RGI']
-        self.layers = ipywidgets.SelectMultiple(
-            options=layer_options,
+    @functools.cached_property
+    def layers(self):
+        """selection for adding layers to map
+        """
+        layers = ipywidgets.SelectMultiple(
+            options=_LAYER_OPTIONS['Global'],
             description='Add Layers:',
             description_tooltip=("Add Layers: contextual layers "
                 "to add to leaflet map"),
             disabled=False,
             style=self.style,
         )
+        layers.observe(self.set_raster_functions)
+        return layers
 
-        # selection for adding raster functions to map
-        self.raster_functions = ipywidgets.Dropdown(
+    @functools.cached_property
+    def raster_functions(self):
+        """selection for adding raster functions to map
+        """
+        raster_functions = ipywidgets.Dropdown(
             options=[],
             description='Raster Layer:',
             description_tooltip=("Raster Layer: contextual raster "
@@ -598,15 +742,15 @@ class widgets:
             disabled=False,
             style=self.style,
         )
-        self.raster_functions.layout.display = 'none'
-
-        # watch widgets for changes
-        self.projection.observe(self.set_layers)
-        self.layers.observe(self.set_raster_functions)
+        raster_functions.layout.display = 'none'
+        return raster_functions
 
-        # single plot widgets
-        # single plot kind
-        self.plot_kind = ipywidgets.Dropdown(
+    # single plot widgets
+    @functools.cached_property
+    def plot_kind(self):
+        """single plot kind
+        """
+        plot_kind = ipywidgets.Dropdown(
             options=['cycles','scatter'],
             value='scatter',
             description='Plot Kind:',
@@ -616,9 +760,15 @@ class widgets:
             disabled=False,
             style=self.style,
         )
+        # watch plot kind widgets for changes
+        plot_kind.observe(self.set_plot_kind)
+        return plot_kind
 
-        # single plot ATL03 classification
-        self.plot_classification = ipywidgets.Dropdown(
+    @functools.cached_property
+    def plot_classification(self):
+        """single plot ATL03 classification
+        """
+        return ipywidgets.Dropdown(
             options = ["atl03", "atl08", "yapc", "none"],
             value = "atl08",
             description = "Classification",
@@ -630,25 +780,34 @@ class widgets:
             disabled = False,
         )
 
-        # selection for reference ground track
-        self.rgt = ipywidgets.Text(
+    @functools.cached_property
+    def rgt(self):
+        """selection for reference ground track
+        """
+        return ipywidgets.Text(
             value='0',
             description="RGT:",
             description_tooltip="RGT: Reference Ground Track to plot",
             disabled=False
         )
 
-        # cycle input text box
-        self.cycle = ipywidgets.Text(
+    @functools.cached_property
+    def cycle(self):
+        """cycle input text box
+        """
+        return ipywidgets.Text(
             value='0',
             description='Cycle:',
             description_tooltip="Cycle: Orbital cycle to plot",
             disabled=False
         )
 
-        # selection for ground track
+    @functools.cached_property
+    def ground_track(self):
+        """selection for ground track
+        """
         ground_track_options = ["gt1l","gt1r","gt2l","gt2r","gt3l","gt3r"]
-        self.ground_track = ipywidgets.Dropdown(
+        return ipywidgets.Dropdown(
             options=ground_track_options,
             value='gt1l',
             description="Track:",
@@ -656,49 +815,158 @@ class widgets:
             disabled=False
         )
 
-        # watch plot kind widgets for changes
-        self.plot_kind.observe(self.set_plot_kind)
-
-        # button and label for output file selection
-        self.file = copy.copy(self.atl06_filename)
-        self.savebutton = ipywidgets.Button(
+    # button and label for output file selection
+    @functools.cached_property
+    def savebutton(self):
+        """button for output file selection
+        """
+        savebutton = ipywidgets.Button(
             description="Save As"
         )
-        self.savelabel = ipywidgets.Text(
+        # connect fileselect button with action
+        savebutton.on_click(self.saveas_file)
+        return savebutton
+
+    @functools.cached_property
+    def savelabel(self):
+        """label for output file selection
+        """
+        savelabel = ipywidgets.Text(
             value=self.file,
             disabled=False
         )
-        # connect fileselect button with action
-        self.savebutton.on_click(self.saveas_file)
-        self.savelabel.observe(self.set_savefile)
-        # create hbox of file selection
-        if os.environ.get("DISPLAY"):
-            self.filesaver = ipywidgets.HBox([
+        savelabel.observe(self.set_savefile)
+        return savelabel
+
+    @functools.cached_property
+    def savechooser(self):
+        """inline file chooser for output file selection
+        """
+        # create the filename label first so that its change events
+        # always keep the chooser synchronized with the output file
+        self.savelabel
+        savechooser = ipyfilechooser.FileChooser(
+            os.getcwd(),
+            filename=self.file,
+            title='Save As',
+            select_default=True,
+            filter_pattern=['*.h5', '*.nc']
+        )
+        # connect file chooser with action
+        savechooser.register_callback(self.set_savechooser)
+        return savechooser
+
+    @functools.cached_property
+    def filesaver(self):
+        """hbox of output file selection
+        """
+        # use jupyter-native file chooser if available
+        # fall back to tkinter dialogs if running with a display
+        if ipyfilechooser is not None:
+            return ipywidgets.HBox([
+                self.savechooser,
+                self.savelabel
+            ])
+        elif os.environ.get("DISPLAY"):
+            return ipywidgets.HBox([
                 self.savebutton,
                 self.savelabel
             ])
         else:
-            self.filesaver = self.savelabel
+            return self.savelabel
 
-        # button and label for input file selection
-        self.loadbutton = ipywidgets.Button(
+    # button and label for input file selection
+    @functools.cached_property
+    def loadbutton(self):
+        """button for input file selection
+        """
+        loadbutton = ipywidgets.Button(
             description="File select"
         )
-        self.loadlabel = ipywidgets.Text(
+        # connect fileselect button with action
+        loadbutton.on_click(self.select_file)
+        return loadbutton
+
+    @functools.cached_property
+    def loadlabel(self):
+        """label for input file selection
+        """
+        loadlabel = ipywidgets.Text(
             value='',
             disabled=False
         )
-        # connect fileselect button with action
-        self.loadbutton.on_click(self.select_file)
-        self.loadlabel.observe(self.set_loadfile)
-        # create hbox of file selection
-        if os.environ.get("DISPLAY"):
-            self.fileloader = ipywidgets.HBox([
+        loadlabel.observe(self.set_loadfile)
+        return loadlabel
+
+    @functools.cached_property
+    def loadchooser(self):
+        """inline file chooser for input file selection
+        """
+        loadchooser = ipyfilechooser.FileChooser(
+            os.getcwd(),
+            title='File select',
+            filter_pattern=['*.h5', '*.nc']
+        )
+        # connect file chooser with action
+        loadchooser.register_callback(self.set_loadchooser)
+        return loadchooser
+
+    @functools.cached_property
+    def fileloader(self):
+        """hbox of input file selection
+        """
+        # use jupyter-native file chooser if available
+        # fall back to tkinter dialogs if running with a display
+        if ipyfilechooser is not None:
+            return ipywidgets.HBox([
+                self.loadchooser,
+                self.loadlabel
+            ])
+        elif os.environ.get("DISPLAY"):
+            return ipywidgets.HBox([
                 self.loadbutton,
                 self.loadlabel
             ])
         else:
-            self.fileloader = self.loadlabel
+            return self.loadlabel
+
+    # observe widget changes after they have settled
+    def observe_debounced(self, widget, handler, wait_ms=150, names='value'):
+        """Observes a widget and only calls the handler once changes
+        have stopped for a period of time, such as for redrawing
+        leaflet maps from notebook callbacks
+
+        Parameters
+        ----------
+        widget : obj, ipywidgets object to observe
+        handler : obj, callback function for widget changes
+        wait_ms : int, milliseconds to wait after the latest change
+        names : str or list, widget traits to observe
+        """
+        # trait names need to be hashable for identifying observers
+        if isinstance(names, list):
+            names = tuple(names)
+        # replace any prior debounced observer for the widget and handler
+        key = (id(widget), handler, names)
+        if key in self._debounced:
+            widget.unobserve(self._debounced[key], names=names)
+        # pending call of the handler
+        pending = None
+        def debounced(change):
+            nonlocal pending
+            # call immediately if there is no running event loop
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                handler(change)
+                return
+            # cancel the pending call and wait for the latest change
+            if pending is not None:
+                pending.cancel()
+            pending = loop.call_later(wait_ms/1000.0, handler, change)
+        widget.observe(debounced, names=names)
+        self._debounced[key] = debounced
+        return debounced
 
     # function for setting photon classifications
     def set_classification(self, sender):
@@ -748,24 +1016,14 @@ class widgets:
         # default ATL03 confidence
         self.confidence.value = -1
         # set land class options
-        land_options = [
-            'atl08_noise',
-            'atl08_ground',
-            'atl08_canopy',
-            'atl08_top_of_canopy',
-            'atl08_unclassified'
-        ]
-        self.land_class.value = land_options
+        self.land_class.value = _LAND_OPTIONS
         # set default ATL03 length
         self.length.value = 20
         # update variable list for ATL03 variables
-        variable_list = ['atl03_cnf', 'atl08_class', 'cycle', 'delta_time',
-            'x_atc', 'height', 'pair', 'quality_ph', 'rgt', 'sc_orient',
-            'segment_dist', 'segment_id', 'track', 'yapc_score']
-        self.variable.options = variable_list
+        self.variable.options = _ATL03_VARIABLES
         self.variable.value = 'height'
         # set default filename
-        self.file = copy.copy(self.atl03_filename)
+        self.file = self.atl03_filename
         self.savelabel.value = self.file
 
     def set_atl06_defaults(self):
@@ -782,13 +1040,10 @@ class widgets:
         # set default ATL06-SR length
         self.length.value = 40
         # update variable list for ATL06-SR variables
-        variable_list = ['h_mean', 'h_sigma', 'dh_fit_dx', 'dh_fit_dy',
-            'rms_misfit', 'w_surface_window_final', 'delta_time',
-            'cycle', 'rgt']
-        self.variable.options = variable_list
+        self.variable.options = _ATL06_VARIABLES
         self.variable.value = 'h_mean'
         # set default filename
-        self.file = copy.copy(self.atl06_filename)
+        self.file = self.atl06_filename
         self.savelabel.value = self.file
 
     def set_atl08_defaults(self):
@@ -801,12 +1056,7 @@ class widgets:
         # default ATL08-SR confidence
         self.confidence.value = -1
         # set land class options
-        land_options = [
-            'atl08_ground',
-            'atl08_canopy',
-            'atl08_top_of_canopy',
-        ]
-        self.land_class.value = land_options
+        self.land_class.value = _ATL08_LAND_OPTIONS
         # set default ATL08-SR length
         self.length.value = 30
         # set PhoREAL parameters
@@ -816,13 +1066,10 @@ class widgets:
         self.phoreal_above.value = False
         self.phoreal_waveform.value = False
         # update variable list for ATL08-SR variables
-        variable_list = ['h_canopy', 'h_min_canopy', 'h_mean_canopy',
-            'h_max_canopy', 'canopy_openness', 'h_te_median',
-            'landcover', 'snowcover', 'solar_elevation', 'cycle', 'rgt']
-        self.variable.options = variable_list
+        self.variable.options = _ATL08_VARIABLES
         self.variable.value = 'h_canopy'
         # set default filename
-        self.file = copy.copy(self.atl08_filename)
+        self.file = self.atl08_filename
         self.savelabel.value = self.file
 
     def atl03(self, **kwargs):
@@ -933,12 +1180,7 @@ class widgets:
     def set_layers(self, sender):
         """function for updating available map layers
         """
-        if (self.projection.value == 'Global'):
-            layer_options = ['3DEP','ASTER GDEM','ESRI imagery','GLIMS','RGI']
-        elif (self.projection.value == 'North'):
-            layer_options = ['ESRI imagery','ArcticDEM']
-        elif (self.projection.value == 'South'):
-            layer_options = ['LIMA','MOA','RAMP','REMA']
+        layer_options = _LAYER_OPTIONS[self.projection.value]
         self.layers.options=layer_options
         self.layers.value=[]
 
@@ -1016,6 +1258,17 @@ class widgets:
         """return filename from saveas function
         """
         self.file = self.savelabel.value
+        # keep an existing inline file chooser in sync with the label
+        if ('savechooser' in self.__dict__) and \
+            (self.file != self.savechooser.selected):
+            path, filename = os.path.split(self.file)
+            if filename and os.path.isdir(path or os.curdir):
+                self.savechooser.reset(path=path or None, filename=filename)
+
+    def set_savechooser(self, chooser):
+        """return filename from output file chooser
+        """
+        self.savelabel.value = chooser.selected
 
     def select_file(self, b):
         """function for file selection
@@ -1040,6 +1293,11 @@ class widgets:
         """
         self.file = self.loadlabel.value
 
+    def set_loadchooser(self, chooser):
+        """return filename from input file chooser
+        """
+        self.loadlabel.value = chooser.selected
+
     @property
     def atl03_filename(self):
         """default input and output file string for ATL03 requests
@@ -1561,8 +1819,8 @@ projections = Bunch(
             custom=True,
             proj4def="""+proj=stere +lat_0=90 +lat_ts=90 +lon_0=-150 +k=0.994
                 +x_0=2000000 +y_0=2000000 +datum=WGS84 +units=m +no_defs""",
-            origin=[-2.8567784109255e+07, 3.2567784109255e+07],
-            resolutions=[
+            origin=(-2.8567784109255e+07, 3.2567784109255e+07),
+            resolutions=(
                 238810.813354,
                 119405.406677,
                 59702.7033384999,
@@ -1587,7 +1845,7 @@ projections = Bunch(
                 0.113873869697739,
                 0.05693693484887,
                 0.028468467424435
-            ],
+            ),
             bounds=[
                 [-2623285.8808999992907047,-2623285.8808999992907047],
                 [6623285.8803000003099442,6623285.8803000003099442]
@@ -1610,8 +1868,8 @@ projections = Bunch(
             custom=True,
             proj4def="""+proj=stere +lat_0=-90 +lat_ts=-71 +lon_0=0 +k=1
                 +x_0=0 +y_0=0 +datum=WGS84 +units=m +no_defs""",
-            origin=[-3.06361E7, 3.0636099999999993E7],
-            resolutions=[
+            origin=(-3.06361E7, 3.0636099999999993E7),
+            resolutions=(
                 67733.46880027094,
                 33866.73440013547,
                 16933.367200067736,
@@ -1621,7 +1879,7 @@ projections = Bunch(
                 1058.3354500042335,
                 529.1677250021168,
                 264.5838625010584,
-            ],
+            ),
             bounds=[
                 [-4524583.19363305,-4524449.487765655],
                 [4524449.4877656475,4524583.193633042]
@@ -1632,8 +1890,8 @@ projections = Bunch(
             custom=True,
             proj4def="""+proj=stere +lat_0=-90 +lat_ts=-71 +lon_0=0 +k=1
                 +x_0=0 +y_0=0 +datum=WGS84 +units=m +no_defs""",
-            origin=[-3.369955099203E7,3.369955101703E7],
-            resolutions=[238810.81335399998,
+            origin=(-3.369955099203E7,3.369955101703E7),
+            resolutions=(238810.81335399998,
                 119405.40667699999,
                 59702.70333849987,
                 29851.351669250063,
@@ -1657,7 +1915,7 @@ projections = Bunch(
                 0.113873869697739,
                 0.05693693484887,
                 0.028468467424435
-            ],
+            ),
             bounds=[
                 [-9913957.327914657,-5730886.461772691],
                 [9913957.327914657,5730886.461773157]
@@ -1886,6 +2144,208 @@ def _load_dict(data):
 # create traitlets of basemap providers
 basemaps = _load_dict(providers)
 
+# create tile layers of basemap providers once
+# so that the same layer objects can be removed from maps
+layers.NASAGIBS = Bunch(
+    ASTER_GDEM = ipyleaflet.basemap_to_tiles(
+        basemaps.NASAGIBS.ASTER_GDEM_Greyscale_Shaded_Relief)
+)
+layers.Esri = Bunch(
+    WorldImagery = ipyleaflet.basemap_to_tiles(
+        ipyleaflet.basemaps.Esri.WorldImagery),
+    ArcticImagery = ipyleaflet.basemap_to_tiles(
+        basemaps.Esri.ArcticImagery)
+)
+
+# convert an array of RGBA colors to HEX color strings
+def _to_hex(rgba):
+    """Converts an array of RGBA colors to HEX color strings
+
+    Parameters
+    ----------
+    rgba : np.ndarray, RGBA colors with values from 0 to 1
+    """
+    # scale red, green and blue channels to 8-bit integers
+    rgb = np.round(255.0*np.asarray(rgba)[:,:3]).astype(np.uint32)
+    # pack channels into a single 24-bit integer for each color
+    packed = (rgb[:,0] << 16) | (rgb[:,1] << 8) | rgb[:,2]
+    return np.char.mod('#%06x', packed)
+
+# compiled kernel for converting values to HEX color strings
+if numba is not None:
+    # ASCII codes for hexadecimal digits
+    _HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+
+    @numba.njit(cache=True, parallel=True)
+    def _pack_hex(values, vmin, vmax, lut):
+        """Converts values to ASCII HEX color codes in a single pass
+
+        Parameters
+        ----------
+        values : np.ndarray, values to convert
+        vmin : float, minimum value for linear normalization
+        vmax : float, maximum value for linear normalization
+        lut : np.ndarray, 8-bit RGB lookup table of colormap
+        """
+        n = values.shape[0]
+        N = lut.shape[0]
+        hexcodes = np.empty((n, 7), dtype=np.uint8)
+        for i in numba.prange(n):
+            hexcodes[i,0] = ord('#')
+            # invalid values are drawn as black
+            if np.isnan(values[i]):
+                hexcodes[i,1:] = ord('0')
+                continue
+            # normalize and clip value to be within vmin and vmax
+            if (vmax > vmin):
+                t = min(max((values[i] - vmin)/(vmax - vmin), 0.0), 1.0)
+            else:
+                t = 0.0
+            # index of color in lookup table
+            k = min(int(t*N), N - 1)
+            for j in range(3):
+                hexcodes[i,2*j+1] = _HEX_DIGITS[lut[k,j] >> 4]
+                hexcodes[i,2*j+2] = _HEX_DIGITS[lut[k,j] & 15]
+        return hexcodes
+
+# calculate percentiles of an array without sorting
+def _percentile(values, q):
+    """Calculates percentiles of valid values using linear interpolation
+    between the order statistics found with a partial sort
+
+    Parameters
+    ----------
+    values : np.ndarray, values to calculate percentiles
+    q : tuple, quantiles to calculate from 0 to 1
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if (values.size == 0):
+        return np.full(len(q), np.nan)
+    # fractional positions of quantiles in sorted values
+    position = np.asarray(q)*(values.size - 1)
+    lower = np.floor(position).astype(int)
+    upper = np.ceil(position).astype(int)
+    # partially sort values around the bounding order statistics
+    partitioned = np.partition(values, np.union1d(lower, upper))
+    return partitioned[lower] + (position - lower)*(partitioned[upper] - partitioned[lower])
+
+# convert values to HEX color strings using a colormap
+def _colorize(values, cmap, norm):
+    """Converts values to HEX color strings
+
+    Parameters
+    ----------
+    values : np.ndarray, values to convert
+    cmap : obj, matplotlib colormap
+    norm : obj, matplotlib color normalization object
+    """
+    # compiled kernel only supports scaled linear normalizations
+    if (numba is not None) and (type(norm) is colors.Normalize) and norm.scaled():
+        # 8-bit RGB lookup table of colormap
+        lut = np.round(255.0*cmap(np.arange(cmap.N))[:,:3]).astype(np.uint8)
+        hexcodes = _pack_hex(np.asarray(values, dtype=np.float64),
+            float(norm.vmin), float(norm.vmax), lut)
+        return hexcodes.view('S7').ravel().astype('U7')
+    return _to_hex(cmap(norm(values)))
+
+# get discretized colormap from cache
+def _get_cmap(name, N=256):
+    """Returns a cached discretized matplotlib colormap
+
+    Parameters
+    ----------
+    name : str or obj, matplotlib colormap
+    N : int or NoneType, number of discrete colors in colormap
+    """
+    # colormap objects cannot be used as cache keys
+    if isinstance(name, colors.Colormap):
+        return name if N is None else name.resampled(N)
+    return _get_registered_cmap(name, N)
+
+@functools.lru_cache(maxsize=None)
+def _get_registered_cmap(name, N):
+    """Returns a discretized copy of a registered matplotlib colormap
+
+    Parameters
+    ----------
+    name : str, matplotlib colormap
+    N : int or NoneType, number of discrete colors in colormap
+    """
+    cmap = matplotlib.colormaps[name]
+    return cmap if N is None else cmap.resampled(N)
+
+# get linear normalization for plot range
+def _get_norm(norm, vmin, vmax):
+    """Returns a linear matplotlib normalization,
+    reusing the previous one if the plot range is unchanged
+
+    Parameters
+    ----------
+    norm : obj or NoneType, previous matplotlib normalization
+    vmin : float, minimum value for normalization
+    vmax : float, maximum value for normalization
+    """
+    if (norm is None) or (norm.vmin != vmin) or (norm.vmax != vmax):
+        norm = colors.Normalize(vmin=vmin, vmax=vmax, clip=True)
+    return norm
+
+# fingerprint the plotted features of a GeoDataFrame
+def _fingerprint(gdf):
+    """Returns a hash of the index and geometries of a GeoDataFrame
+
+    Parameters
+    ----------
+    gdf : obj, GeoDataFrame to fingerprint
+    """
+    index = gpd.pd.util.hash_pandas_object(gdf.index, index=False).values
+    geometry = gdf.geometry.values
+    return hash((len(gdf), index.tobytes(),
+        shapely.get_type_id(geometry).tobytes(),
+        shapely.get_coordinates(geometry).tobytes()))
+
+# convert GeoDataFrame attributes to GeoJSON-like feature properties
+def _to_properties(gdf):
+    """Returns the non-geometry columns of a GeoDataFrame
+    as a dictionary of python scalars for each row
+
+    Parameters
+    ----------
+    gdf : obj, GeoDataFrame to convert
+    """
+    # convert properties to objects to get python scalars
+    # and output missing (NaN) values as JSON null
+    columns = gdf.columns.drop(gdf.geometry.name)
+    properties = gdf[columns].astype(object).values
+    properties[gdf[columns].isna().values] = None
+    columns = columns.tolist()
+    return [dict(zip(columns, row)) for row in properties]
+
+# convert GeoDataFrame to a GeoJSON-like feature collection
+def _to_geo_dict(gdf):
+    """Returns a GeoDataFrame as a python feature collection
+    building point geometries directly from coordinate arrays
+
+    Parameters
+    ----------
+    gdf : obj, GeoDataFrame to convert
+    """
+    geometry = gdf.geometry
+    # use the geo interface for any geometries other than 2D points
+    if not (geometry.geom_type == 'Point').all() or \
+        geometry.is_empty.any() or geometry.has_z.any():
+        return gdf.__geo_interface__
+    # build point features without a shapely mapping for each row
+    features = [{'id': str(i), 'type': 'Feature',
+        'properties': properties,
+        'geometry': {'type': 'Point', 'coordinates': (x, y)}}
+        for i, properties, x, y in zip(np.asarray(gdf.index),
+            _to_properties(gdf), geometry.x.tolist(), geometry.y.tolist())]
+    return {'type': 'FeatureCollection', 'features': features}
+
+# format of cursor location label
+_LAT_LON_FMT = u"Latitude: {:8.4f}\u00B0, Longitude: {:8.4f}\u00B0"
+
 # draw ipyleaflet map
 class leaflet:
     def __init__(self, projection, **kwargs):
@@ -1983,11 +2443,16 @@ class leaflet:
         self.tooltip = None
         self.fields = []
         self.colorbar = None
+        # initialize cached matplotlib colorbar
+        self._cbar = None
+        self._cbar_layout = None
         # initialize hover control
         self.hover_control = None
         # initialize feature callbacks
         self.selected_callback = None
         self.region_callback = None
+        # initialize normalization cache
+        self._norm = None
 
     # add sliderule regions to map
     def add_region(self, regions, **kwargs):
@@ -2038,11 +2503,11 @@ class leaflet:
                 elif isinstance(layer,str) and (layer == '3DEP'):
                     self.map.add(layers.USGS.Elevation)
                 elif isinstance(layer,str) and (layer == 'ASTER GDEM'):
-                    self.map.add(ipyleaflet.basemap_to_tiles(basemaps.NASAGIBS.ASTER_GDEM_Greyscale_Shaded_Relief))
+                    self.map.add(layers.NASAGIBS.ASTER_GDEM)
                 elif isinstance(layer,str) and (self.crs == 'EPSG:3857') and (layer == 'ESRI imagery'):
-                    self.map.add(ipyleaflet.basemap_to_tiles(ipyleaflet.basemaps.Esri.WorldImagery))
+                    self.map.add(layers.Esri.WorldImagery)
                 elif isinstance(layer,str) and (self.crs == 'EPSG:5936') and (layer == 'ESRI imagery'):
-                    self.map.add(ipyleaflet.basemap_to_tiles(basemaps.Esri.ArcticImagery))
+                    self.map.add(layers.Esri.ArcticImagery)
                 elif isinstance(layer,str) and (layer == 'ArcticDEM'):
                     # set raster layer
                     im = layers.PGC.ArcticDEM
@@ -2107,11 +2572,11 @@ class leaflet:
                 elif isinstance(layer,str) and (layer == '3DEP'):
                     self.map.remove(layers.USGS.Elevation)
                 elif isinstance(layer,str) and (layer == 'ASTER GDEM'):
-                    self.map.remove(ipyleaflet.basemap_to_tiles(basemaps.NASAGIBS.ASTER_GDEM_Greyscale_Shaded_Relief))
+                    self.map.remove(layers.NASAGIBS.ASTER_GDEM)
                 elif isinstance(layer,str) and (self.crs == 'EPSG:3857') and (layer == 'ESRI imagery'):
-                    self.map.add(ipyleaflet.basemap_to_tiles(ipyleaflet.basemaps.Esri.WorldImagery))
+                    self.map.remove(layers.Esri.WorldImagery)
                 elif isinstance(layer,str) and (self.crs == 'EPSG:5936') and (layer == 'ESRI imagery'):
-                    self.map.remove(ipyleaflet.basemap_to_tiles(basemaps.Esri.ArcticImagery))
+                    self.map.remove(layers.Esri.ArcticImagery)
                 elif isinstance(layer,str) and (layer == 'ArcticDEM'):
                     self.map.remove(layers.PGC.ArcticDEM)
                 elif isinstance(layer,str) and (layer == 'LIMA'):
@@ -2140,21 +2605,26 @@ class leaflet:
     def handle_interaction(self, **kwargs):
         """callback for handling mouse motion and setting location label
         """
-        if (kwargs.get('type') == 'mousemove'):
-            lat,lon = kwargs.get('coordinates')
-            lon = sliderule.io.wrap_longitudes(lon)
-            self.cursor.value = u"""Latitude: {d[0]:8.4f}\u00B0,
-                Longitude: {d[1]:8.4f}\u00B0""".format(d=[lat,lon])
+        if (kwargs.get('type') != 'mousemove'):
+            return
+        lat,lon = kwargs.get('coordinates')
+        # wrap scalar longitude to -180:180 without numpy overhead
+        lon = ((lon + 180.0) % 360.0) - 180.0
+        self.cursor.value = _LAT_LON_FMT.format(lat, lon)
 
     # keep track of rectangles and polygons drawn on map
     def handle_draw(self, obj, action, geo_json):
         """callback for handling draw events and interactively
         creating SlideRule region objects
         """
-        lon,lat = np.transpose(geo_json['geometry']['coordinates'])
-        lon = sliderule.io.wrap_longitudes(lon)
-        cx,cy = sliderule.io.centroid(lon,lat)
-        wind = sliderule.io.winding(lon,lat)
+        geometry = geo_json['geometry']
+        # only polygons and rectangles can be SlideRule regions
+        if (geometry['type'] != 'Polygon'):
+            return self
+        # longitude and latitude views of the exterior ring vertices
+        coordinates = np.asarray(geometry['coordinates'][0], dtype=np.float64)
+        lon,lat = coordinates[:,0],coordinates[:,1]
+        lon,lat,cx,cy,wind = sliderule.io.summarize_ring(lon,lat)
         # set winding to counter-clockwise
         if (wind > 0):
             lon = lon[::-1]
@@ -2215,47 +2685,42 @@ class leaflet:
         kwargs.setdefault('position', 'topright')
         # add warning that function is deprecated
         logger.critical(f"Deprecated. Will be removed in a future release")
-        # remove any prior instances of a data layer
-        if self.geojson is not None:
-            self.map.remove(self.geojson)
+        # prior instance of a data layer to replace
+        previous = self.geojson
         if kwargs['stride'] is not None:
-            stride = np.copy(kwargs['stride'])
+            stride = int(kwargs['stride'])
         elif (gdf.shape[0] > kwargs['max_plot_points']):
             stride = int(gdf.shape[0]//kwargs['max_plot_points'])
         else:
             stride = 1
-        # sliced geodataframe for plotting
-        geodataframe = gdf[slice(None,None,stride)]
-        column_name = copy.copy(kwargs['column_name'])
-        geodataframe['data'] = geodataframe[column_name]
+        # sliced values for plotting
+        column_name = kwargs['column_name']
+        values = gdf[column_name].values[::stride]
         # set colorbar limits to 2-98 percentile
         # if not using a defined plot range
-        clim = geodataframe['data'].quantile((0.02, 0.98)).values
+        clim = _percentile(values, (0.02, 0.98))
         if kwargs['vmin'] is None:
             vmin = clim[0]
         else:
-            vmin = np.copy(kwargs['vmin'])
+            vmin = kwargs['vmin']
         if kwargs['vmax'] is None:
             vmax = clim[-1]
         else:
-            vmax = np.copy(kwargs['vmax'])
+            vmax = kwargs['vmax']
         # create matplotlib normalization
         if kwargs['norm'] is None:
-            norm = colors.Normalize(vmin=vmin, vmax=vmax, clip=True)
+            self._norm = _get_norm(self._norm, vmin, vmax)
+            norm = self._norm
         else:
             norm = copy.copy(kwargs['norm'])
-        # normalize data to be within vmin and vmax
-        normalized = norm(geodataframe['data'])
-        # create HEX colors for each point in the dataframe
-        geodataframe["color"] = np.apply_along_axis(colors.to_hex, 1,
-            cm.get_cmap(kwargs['cmap'], 256)(normalized))
+        # sliced geodataframe with HEX colors for each plotted point
+        geodataframe = gdf.iloc[::stride].assign(data=values,
+            color=_colorize(values, _get_cmap(kwargs['cmap']), norm))
         # leaflet map point style
         point_style = {key:kwargs[key] for key in ['radius','fillOpacity','weight']}
         # convert to GeoJSON object
-        self.geojson = ipyleaflet.GeoJSON(data=geodataframe.__geo_interface__,
+        self.geojson = ipyleaflet.GeoJSON(data=_to_geo_dict(geodataframe),
             point_style=point_style, style_callback=self.style_callback)
-        # add GeoJSON object to map
-        self.map.add(self.geojson)
         # fields for tooltip views
         if kwargs['fields'] is None:
             self.fields = geodataframe.columns.drop(
@@ -2273,11 +2738,17 @@ class leaflet:
             self.geojson.on_hover(self.handle_hover)
             self.geojson.on_msg(self.handle_mouseout)
             self.geojson.on_click(self.handle_click)
-        # add colorbar
-        if kwargs['colorbar']:
-            self.add_colorbar(column_name=column_name,
-                cmap=kwargs['cmap'], norm=norm,
-                position=kwargs['position'])
+        # replace data layer and colorbar with a single map update
+        with self.map.hold_sync():
+            if previous is not None:
+                self.map.remove(previous)
+            # add GeoJSON object to map
+            self.map.add(self.geojson)
+            # add colorbar
+            if kwargs['colorbar']:
+                self.add_colorbar(column_name=column_name,
+                    cmap=kwargs['cmap'], norm=norm,
+                    position=kwargs['position'])
 
     # functional call for setting colors of each point
     def style_callback(self, feature):
@@ -2352,30 +2823,43 @@ class leaflet:
         kwargs.setdefault('position', 'topright')
         kwargs.setdefault('width', 6.0)
         kwargs.setdefault('height', 0.4)
-        # remove any prior instances of a colorbar
-        if self.colorbar is not None:
-            self.map.remove(self.colorbar)
         # colormap for colorbar
-        cmap = cm.get_cmap(kwargs['cmap'])
-        # create matplotlib colorbar
-        _, ax = plt.subplots(figsize=(kwargs['width'], kwargs['height']))
-        cbar = matplotlib.colorbar.ColorbarBase(ax, cmap=cmap,
-            norm=kwargs['norm'], alpha=kwargs['alpha'],
-            orientation=kwargs['orientation'],
-            label=kwargs['column_name'])
-        cbar.solids.set_rasterized(True)
-        cbar.ax.tick_params(which='both', width=1, direction='in')
+        cmap = _get_cmap(kwargs['cmap'], N=None)
+        mappable = cm.ScalarMappable(norm=kwargs['norm'], cmap=cmap)
+        # colorbar properties that require a new figure
+        layout = (kwargs['alpha'], kwargs['orientation'],
+            kwargs['width'], kwargs['height'])
+        if (self._cbar is None) or (self._cbar_layout != layout):
+            # create matplotlib colorbar outside of pyplot
+            fig = matplotlib.figure.Figure(
+                figsize=(kwargs['width'], kwargs['height']))
+            ax = fig.add_subplot()
+            self._cbar = matplotlib.colorbar.Colorbar(ax, mappable=mappable,
+                alpha=kwargs['alpha'], orientation=kwargs['orientation'])
+            self._cbar.ax.tick_params(which='both', width=1, direction='in')
+            self._cbar_layout = layout
+        else:
+            # update colormap and normalization of existing colorbar
+            self._cbar.update_normal(mappable)
+            # update_normal resets the opacity to that of the mappable
+            self._cbar.solids.set_alpha(kwargs['alpha'])
+        self._cbar.set_label(kwargs['column_name'])
+        self._cbar.solids.set_rasterized(True)
         # save colorbar to in-memory png object
         png = io.BytesIO()
-        plt.savefig(png, bbox_inches='tight', format='png')
-        png.seek(0)
-        # create output widget
-        output = ipywidgets.Image(value=png.getvalue(), format='png')
-        self.colorbar = ipyleaflet.WidgetControl(widget=output,
-            transparent_bg=True, position=kwargs['position'])
-        # add colorbar
-        self.map.add(self.colorbar)
-        plt.close()
+        self._cbar.ax.figure.savefig(png, bbox_inches='tight', format='png')
+        # update image of existing colorbar widget
+        if self.colorbar is not None:
+            self.colorbar.widget.value = png.getvalue()
+            self.colorbar.position = kwargs['position']
+        else:
+            # create output widget
+            output = ipywidgets.Image(value=png.getvalue(), format='png')
+            self.colorbar = ipyleaflet.WidgetControl(widget=output,
+                transparent_bg=True, position=kwargs['position'])
+        # add colorbar if not already on map
+        if self.colorbar not in self.map.controls:
+            self.map.add(self.colorbar)
 
     @staticmethod
     def default_atl03_fields():
@@ -2418,7 +2902,18 @@ class LeafletMap:
     based on ipyleaflet
     """
 
+    def __new__(cls, gdf):
+        # pandas no longer caches accessors on each dataframe
+        # reuse the prior accessor to keep plot states between calls
+        accessor = gdf.__dict__.get('_leaflet_accessor')
+        if isinstance(accessor, cls):
+            return accessor
+        return super().__new__(cls)
+
     def __init__(self, gdf):
+        # skip initialization of reused accessors
+        if gdf.__dict__.get('_leaflet_accessor') is self:
+            return
         # initialize map
         self.map = None
         self.crs = None
@@ -2426,15 +2921,25 @@ class LeafletMap:
         self._gdf = gdf
         # initialize data and colorbars
         self.geojson = None
+        self.overlay = None
         self.tooltip = None
         self.tooltip_width = None
         self.tooltip_height = None
         self.fields = []
         self.colorbar = None
+        # initialize cached matplotlib colorbar
+        self._cbar = None
+        self._cbar_layout = None
         # initialize hover control
         self.hover_control = None
+        # initialize plotted geometry of GeoJSON layer
+        self._geometry_key = None
         # initialize selected feature
         self.selected_callback = None
+        # initialize normalization cache
+        self._norm = None
+        # cache accessor on the geodataframe
+        object.__setattr__(gdf, '_leaflet_accessor', self)
 
     # add geodataframe data to leaflet map
     def GeoData(self, m, **kwargs):
@@ -2457,6 +2962,13 @@ class LeafletMap:
         fields : list, GeoDataFrame fields to show in hover tooltips
         colorbar : bool, show colorbar for rendered variable
         position : str, position of colorbar on leaflet map
+        backend : str, rendering backend for plot markers
+
+            - 'geojson' : GeoJSON features for each plot marker
+            - 'datashader' : rasterized image overlay of all points
+            - 'heatmap' : heatmap of points weighted by normalized values,
+              showing the density of points rather than values of each point
+        max_image_size : int, maximum dimension of rasterized images
         """
         kwargs.setdefault('column_name', 'h_mean')
         kwargs.setdefault('cmap', 'viridis')
@@ -2474,58 +2986,115 @@ class LeafletMap:
         kwargs.setdefault('fields', [])
         kwargs.setdefault('colorbar', True)
         kwargs.setdefault('position', 'topright')
+        kwargs.setdefault('backend', 'geojson')
+        kwargs.setdefault('max_image_size', 2048)
         # set map and map coordinate reference system
         self.map = m
         self.crs = m.crs['name']
-        # remove any prior instances of a data layer
-        if self.geojson is not None:
-            self.map.remove(self.geojson)
+        # rasterized layers require the optional datashader package
+        if (kwargs['backend'] == 'datashader') and \
+            (importlib.util.find_spec('datashader') is None):
+            logger.warning("Rasterized layers require datashader")
+            kwargs['backend'] = 'geojson'
+        # image overlays are only georeferenced for web mercator maps
+        # ipyleaflet names its web mercator projection without a colon
+        if (kwargs['backend'] == 'datashader') and \
+            (self.crs not in ('EPSG3857', 'EPSG:3857')):
+            logger.warning(f"Rasterized layers not supported for {self.crs}")
+            kwargs['backend'] = 'geojson'
+        # rasterized and heatmap layers can only be created from points
+        if (kwargs['backend'] in ('datashader', 'heatmap')) and \
+            not (self._gdf.geom_type == 'Point').all():
+            logger.warning("Rasterized and heatmap layers require point geometries")
+            kwargs['backend'] = 'geojson'
         if kwargs['stride'] is not None:
-            stride = np.copy(kwargs['stride'])
+            stride = int(kwargs['stride'])
         elif (self._gdf.shape[0] > kwargs['max_plot_points']):
             stride = int(self._gdf.shape[0]//kwargs['max_plot_points'])
         else:
             stride = 1
-        # sliced geodataframe for plotting
-        geodataframe = self._gdf[slice(None,None,stride)]
-        self.column_name = copy.copy(kwargs['column_name'])
-        geodataframe['data'] = geodataframe[self.column_name]
+        # sliced geodataframe of plotted features
+        plotted = self._gdf.iloc[::stride]
+        # reuse the GeoJSON layer if the plotted features are unchanged
+        if (kwargs['backend'] == 'geojson'):
+            geometry_key = (id(self.map), stride, kwargs['tooltip'],
+                len(self._gdf), tuple(self._gdf.columns), _fingerprint(plotted))
+        else:
+            geometry_key = None
+        reuse = (geometry_key is not None) and (self.geojson is not None) and \
+            (self._geometry_key == geometry_key) and \
+            (len(self.geojson.data['features']) == len(plotted))
+        # prior instances of a data layer to replace
+        if reuse:
+            previous = []
+        else:
+            previous = [l for l in (self.geojson, self.overlay) if l is not None]
+            self.geojson = None
+            self.overlay = None
+        # sliced values for plotting
+        self.column_name = kwargs['column_name']
+        values = self._gdf[self.column_name].values[::stride]
         # set colorbar limits to 2-98 percentile
         # if not using a defined plot range
-        clim = geodataframe['data'].quantile((0.02, 0.98)).values
+        clim = _percentile(values, (0.02, 0.98))
         if kwargs['vmin'] is None:
             vmin = clim[0]
         else:
-            vmin = np.copy(kwargs['vmin'])
+            vmin = kwargs['vmin']
         if kwargs['vmax'] is None:
             vmax = clim[-1]
         else:
-            vmax = np.copy(kwargs['vmax'])
+            vmax = kwargs['vmax']
         # create matplotlib normalization
         if kwargs['norm'] is None:
-            norm = colors.Normalize(vmin=vmin, vmax=vmax, clip=True)
+            self._norm = _get_norm(self._norm, vmin, vmax)
+            norm = self._norm
         else:
             norm = copy.copy(kwargs['norm'])
-        # normalize data to be within vmin and vmax
-        normalized = norm(geodataframe['data'])
-        # create HEX colors for each point in the dataframe
-        geodataframe["color"] = np.apply_along_axis(colors.to_hex, 1,
-            cm.get_cmap(kwargs['cmap'], 256)(normalized))
+        # rasterize all points to a single image overlay
+        if (kwargs['backend'] == 'datashader'):
+            self.overlay = self.rasterize(column_name=self.column_name,
+                cmap=kwargs['cmap'], norm=norm,
+                max_image_size=kwargs['max_image_size'])
+            self.replace_layers(previous, self.overlay,
+                column_name=self.column_name, cmap=kwargs['cmap'],
+                norm=norm, colorbar=kwargs['colorbar'],
+                position=kwargs['position'])
+            return
+        # create a heatmap of all valid points
+        if (kwargs['backend'] == 'heatmap'):
+            # normalize data to be within vmin and vmax
+            self.overlay = self.heatmap(self._gdf.geometry.values[::stride],
+                norm(values), cmap=kwargs['cmap'])
+            # heatmap intensities accumulate for overlapping points
+            # so label the colorbar as a relative intensity
+            self.replace_layers(previous, self.overlay,
+                column_name=f'{self.column_name} (relative intensity)',
+                cmap=kwargs['cmap'], norm=colors.Normalize(vmin=0.0, vmax=1.0),
+                colorbar=kwargs['colorbar'], position=kwargs['position'])
+            return
+        # create HEX colors for each plotted point
+        hexcolors = _colorize(values, _get_cmap(kwargs['cmap']), norm)
         # leaflet map point style
         point_style = {key:kwargs[key] for key in ['radius','fillOpacity','weight']}
-        # convert to GeoJSON object
-        self.geojson = ipyleaflet.GeoJSON(data=geodataframe.__geo_interface__,
-            point_style=point_style, style_callback=self.style_callback)
-        # add GeoJSON object to map
-        self.map.add(self.geojson)
+        # sliced geodataframe for plotting
+        geodataframe = plotted.assign(data=values, color=hexcolors)
+        if reuse:
+            # update the properties of the existing GeoJSON features
+            self.geojson.point_style = point_style
+            self.update_geojson(geodataframe)
+        else:
+            # convert to GeoJSON object
+            self.geojson = ipyleaflet.GeoJSON(data=_to_geo_dict(geodataframe),
+                point_style=point_style, style_callback=self.style_callback)
+            self._geometry_key = geometry_key
         # fields for tooltip views
         if kwargs['fields'] is None:
-            self.fields = geodataframe.columns.drop(
-                [geodataframe.geometry.name, "data", "color"])
+            self.fields = self._gdf.columns.drop(self._gdf.geometry.name)
         else:
             self.fields = copy.copy(kwargs['fields'])
         # add hover tooltips
-        if kwargs['tooltip']:
+        if kwargs['tooltip'] and not reuse:
             self.tooltip = ipywidgets.HTML()
             self.tooltip.layout.margin = "0px 20px 20px 20px"
             self.tooltip.layout.visibility = 'hidden'
@@ -2538,11 +3107,160 @@ class LeafletMap:
             self.geojson.on_hover(self.handle_hover)
             self.geojson.on_msg(self.handle_mouseout)
             self.geojson.on_click(self.handle_click)
-        # add colorbar
-        if kwargs['colorbar']:
-            self.add_colorbar(column_name=self.column_name,
-                cmap=kwargs['cmap'], norm=norm,
-                position=kwargs['position'])
+        # add GeoJSON object to map
+        self.replace_layers(previous, self.geojson,
+            column_name=self.column_name, cmap=kwargs['cmap'],
+            norm=norm, colorbar=kwargs['colorbar'],
+            position=kwargs['position'])
+
+    # update GeoJSON features in place
+    def update_geojson(self, geodataframe):
+        """Updates the properties and colors of the GeoJSON layer
+        without rebuilding the feature geometries
+
+        Parameters
+        ----------
+        geodataframe : obj, plotted GeoDataFrame with values and colors
+        """
+        # replace properties and update styles of each feature
+        for feature, properties in zip(self.geojson.data['features'],
+            _to_properties(geodataframe)):
+            properties['style'] = feature['properties'].get('style', {})
+            feature['properties'] = properties
+            properties['style'].update(self.style_callback(feature))
+        # synchronize modified features with the frontend
+        self.geojson.send_state('data')
+
+    # swap data layers and colorbar on leaflet map
+    def replace_layers(self, previous, layer, **kwargs):
+        """Replaces prior data layers and the colorbar with a
+        single synchronization of the leaflet map
+
+        Parameters
+        ----------
+        previous : list, prior data layers to remove
+        layer : obj, data layer to add
+        column_name : str, GeoDataFrame column to plot
+        cmap : str, matplotlib colormap
+        norm : obj, matplotlib color normalization object
+        colorbar : bool, show colorbar for rendered variable
+        position : str, position of colorbar on leaflet map
+        """
+        kwargs.setdefault('column_name', 'h_mean')
+        kwargs.setdefault('cmap', 'viridis')
+        kwargs.setdefault('norm', None)
+        kwargs.setdefault('colorbar', True)
+        kwargs.setdefault('position', 'topright')
+        with self.map.hold_sync():
+            for prior in previous:
+                self.remove(prior)
+            if layer not in self.map.layers:
+                self.map.add(layer)
+            # add colorbar
+            if kwargs['colorbar']:
+                self.add_colorbar(column_name=kwargs['column_name'],
+                    cmap=kwargs['cmap'], norm=kwargs['norm'],
+                    position=kwargs['position'])
+
+    # rasterize geodataframe points to an image overlay
+    def rasterize(self, **kwargs):
+        """Creates an image overlay of GeoDataFrame points
+        aggregated to the resolution of the current map zoom
+
+        Parameters
+        ----------
+        column_name : str, GeoDataFrame column to plot
+        cmap : str, matplotlib colormap
+        norm : obj, matplotlib color normalization object
+        max_image_size : int, maximum dimension of rasterized image
+        """
+        kwargs.setdefault('column_name', 'h_mean')
+        kwargs.setdefault('cmap', 'viridis')
+        kwargs.setdefault('norm', None)
+        kwargs.setdefault('max_image_size', 2048)
+        # import datashader only when rasterizing as it is slow to import
+        import datashader
+        import datashader.transfer_functions
+        # project points to web mercator
+        geometry = self._gdf.geometry.to_crs(epsg=3857)
+        df = gpd.pd.DataFrame(dict(x=geometry.x.values, y=geometry.y.values,
+            data=self._gdf[kwargs['column_name']].values))
+        xmin,ymin,xmax,ymax = geometry.total_bounds
+        # image dimensions from the pixel resolution at the current zoom
+        resolution = 2.0*np.pi*6378137.0/(256.0*2.0**self.map.zoom)
+        width, height = np.clip(np.ceil([(xmax - xmin)/resolution,
+            (ymax - ymin)/resolution]), 1, kwargs['max_image_size']).astype(int)
+        # aggregate points to the mean value within each pixel
+        canvas = datashader.Canvas(plot_width=width, plot_height=height,
+            x_range=(xmin, xmax), y_range=(ymin, ymax))
+        agg = canvas.points(df, 'x', 'y', datashader.mean('data'))
+        # shade aggregate using the discretized colormap
+        cmap = _get_cmap(kwargs['cmap'])
+        palette = _to_hex(cmap(np.arange(cmap.N))).tolist()
+        if kwargs['norm'] is None:
+            span = None
+        else:
+            # apply the color normalization to the aggregate
+            # so that nonlinear normalizations match the colorbar
+            normalized = np.ma.filled(kwargs['norm'](agg.values), np.nan)
+            agg = agg.copy(data=np.asarray(normalized, dtype=np.float64))
+            span = (0.0, 1.0)
+        image = datashader.transfer_functions.shade(agg, cmap=palette,
+            how='linear', span=span)
+        # save image to in-memory png object
+        png = io.BytesIO()
+        image.to_pil().save(png, format='png')
+        url = 'data:image/png;base64,' + base64.b64encode(png.getvalue()).decode()
+        # bounds of image in latitude and longitude
+        corners = gpd.GeoSeries(gpd.points_from_xy([xmin, xmax], [ymin, ymax]),
+            crs='EPSG:3857').to_crs(epsg=4326)
+        bounds = [[corners.y[0], corners.x[0]], [corners.y[1], corners.x[1]]]
+        return ipyleaflet.ImageOverlay(url=url, bounds=bounds,
+            name=kwargs['column_name'])
+
+    # create a heatmap of geodataframe points
+    def heatmap(self, geometry, normalized, **kwargs):
+        """Creates a heatmap layer of GeoDataFrame points
+        weighted by normalized values, where the intensities of
+        overlapping points accumulate up to a maximum of one
+
+        Parameters
+        ----------
+        geometry : obj, point geometries
+        normalized : np.ndarray, normalized values of each point
+        cmap : str, matplotlib colormap
+        """
+        kwargs.setdefault('cmap', 'viridis')
+        # reduce to points with valid values
+        valid = ~np.ma.getmaskarray(normalized) & np.isfinite(normalized)
+        # latitude, longitude and intensity of each point
+        locations = np.column_stack([geometry.y[valid], geometry.x[valid],
+            np.ma.getdata(normalized)[valid]])
+        # gradient of heatmap from the discretized colormap
+        cmap = _get_cmap(kwargs['cmap'])
+        stops = np.linspace(0.0, 1.0, cmap.N)
+        gradient = dict(zip(stops.tolist(), _to_hex(cmap(np.arange(cmap.N))).tolist()))
+        return ipyleaflet.Heatmap(locations=locations.tolist(),
+            gradient=gradient, max=1.0, name=self.column_name)
+
+    # reduce geodataframe to features within a region
+    def query_region(self, region):
+        """Returns the features of the GeoDataFrame
+        that intersect a region
+
+        Parameters
+        ----------
+        region : list or obj, SlideRule region or shapely polygon
+        """
+        # convert sliderule region to a polygon
+        if isinstance(region, list):
+            region = Polygon(np.c_[sliderule.io.from_region(region)])
+        # transform polygon to the coordinate reference system of the data
+        if (self._gdf.crs is not None) and (self._gdf.crs != 'EPSG:4326'):
+            region = gpd.GeoSeries([region], crs='EPSG:4326').to_crs(self._gdf.crs)[0]
+        # query the cached spatial index of the geodataframe
+        indices = self._gdf.sindex.query(region, predicate='intersects')
+        return self._gdf.iloc[np.sort(indices)]
 
     # functional call for setting colors of each point
     def style_callback(self, feature):
@@ -2596,6 +3314,9 @@ class LeafletMap:
         if (action == 'deleted') and self.geojson is not None:
             self.remove(self.geojson)
             self.geojson = None
+        if (action == 'deleted') and self.overlay is not None:
+            self.remove(self.overlay)
+            self.overlay = None
         # remove any prior instances of a colorbar
         if (action == 'deleted') and self.colorbar is not None:
             self.remove(self.colorbar)
@@ -2642,30 +3363,43 @@ class LeafletMap:
         kwargs.setdefault('position', 'topright')
         kwargs.setdefault('width', 6.0)
         kwargs.setdefault('height', 0.4)
-        # remove any prior instances of a colorbar
-        if self.colorbar is not None:
-            self.map.remove(self.colorbar)
         # colormap for colorbar
-        cmap = cm.get_cmap(kwargs['cmap'])
-        # create matplotlib colorbar
-        _, ax = plt.subplots(figsize=(kwargs['width'], kwargs['height']))
-        cbar = matplotlib.colorbar.ColorbarBase(ax, cmap=cmap,
-            norm=kwargs['norm'], alpha=kwargs['alpha'],
-            orientation=kwargs['orientation'],
-            label=kwargs['column_name'])
-        cbar.solids.set_rasterized(True)
-        cbar.ax.tick_params(which='both', width=1, direction='in')
+        cmap = _get_cmap(kwargs['cmap'], N=None)
+        mappable = cm.ScalarMappable(norm=kwargs['norm'], cmap=cmap)
+        # colorbar properties that require a new figure
+        layout = (kwargs['alpha'], kwargs['orientation'],
+            kwargs['width'], kwargs['height'])
+        if (self._cbar is None) or (self._cbar_layout != layout):
+            # create matplotlib colorbar outside of pyplot
+            fig = matplotlib.figure.Figure(
+                figsize=(kwargs['width'], kwargs['height']))
+            ax = fig.add_subplot()
+            self._cbar = matplotlib.colorbar.Colorbar(ax, mappable=mappable,
+                alpha=kwargs['alpha'], orientation=kwargs['orientation'])
+            self._cbar.ax.tick_params(which='both', width=1, direction='in')
+            self._cbar_layout = layout
+        else:
+            # update colormap and normalization of existing colorbar
+            self._cbar.update_normal(mappable)
+            # update_normal resets the opacity to that of the mappable
+            self._cbar.solids.set_alpha(kwargs['alpha'])
+        self._cbar.set_label(kwargs['column_name'])
+        self._cbar.solids.set_rasterized(True)
         # save colorbar to in-memory png object
         png = io.BytesIO()
-        plt.savefig(png, bbox_inches='tight', format='png')
-        png.seek(0)
-        # create output widget
-        output = ipywidgets.Image(value=png.getvalue(), format='png')
-        self.colorbar = ipyleaflet.WidgetControl(widget=output,
-            transparent_bg=True, position=kwargs['position'])
-        # add colorbar
-        self.map.add(self.colorbar)
-        plt.close()
+        self._cbar.ax.figure.savefig(png, bbox_inches='tight', format='png')
+        # update image of existing colorbar widget
+        if self.colorbar is not None:
+            self.colorbar.widget.value = png.getvalue()
+            self.colorbar.position = kwargs['position']
+        else:
+            # create output widget
+            output = ipywidgets.Image(value=png.getvalue(), format='png')
+            self.colorbar = ipyleaflet.WidgetControl(widget=output,
+                transparent_bg=True, position=kwargs['position'])
+        # add colorbar if not already on map
+        if self.colorbar not in self.map.controls:
+            self.map.add(self.colorbar)
 
 @gpd.pd.api.extensions.register_dataframe_accessor("icesat2")
 class ICESat2: